@@ -36,9 +36,15 @@ This implementation keeps the logic completely hardware‑agnostic.
 """
 from __future__ import annotations
 
+import queue
 import random
+import threading
 import time
-from typing import List, Optional, Dict
+from array import array
+from dataclasses import dataclass
+from enum import Enum, auto
+from functools import partial
+from typing import Callable, List, Optional, Dict, Tuple
 from led_controller import init_leds, g1, g2, g3, g4, r1, r2, r3, r4, off1, off2, off3, off4, cleanup #todo install
 import gpiozero #todo install
 from gui import ScoreGUI
@@ -51,117 +57,109 @@ NUM_SENSORS   = 4
 SOC_LEVELS    = 10
 MAX_ACTIONS   = 10
 BUTTONS       = ("charge", "discharge")
-LED_COLOR     = {0: "red", 1: "green"}      # convenience mapping
+ALL_LEDS      = (1 << NUM_SENSORS) - 1      # one bit per sensor LED
+
+# GUI highlight that mirrors each button LED
+_HIGHLIGHT = {"charge": ScoreGUI.highlight_laden, "discharge": ScoreGUI.highlight_entladen}
+
+
+@dataclass(frozen=True, slots=True)
+class HW:
+    """All devices of the game, indexed the way the game addresses them."""
+    sensors:  Tuple[gpiozero.Button, ...]                    # by sensor index
+    buttons:  Dict[str, gpiozero.Button]                     # by button name
+    led_rgb:  Tuple[Tuple[Callable[[], None], ...], ...]     # (off, red, green)
+    led_btn:  Dict[str, gpiozero.LED]                        # by button name
+    windmill: gpiozero.Servo
+    display:  ScoreGUI                                       # score + SoC window
+
+
+def build_hw() -> HW:
+    """Initialize the GPIO pins and the GUI; call from the main (Tk) thread."""
+    if not init_leds(physical_leds=4):
+        print("LED initialization failed. Exiting.")
+    led_rgb = ((off1, r1, g1), (off2, r2, g2), (off3, r3, g3), (off4, r4, g4))
+    for off, _, _ in led_rgb:          # start from a known (dark) state
+        off()
+    return HW(
+        sensors=(
+            gpiozero.Button(4, bounce_time=0.5),     # office
+            gpiozero.Button(17, bounce_time=0.5),    # home
+            gpiozero.Button(27, bounce_time=0.5),    # shop
+            gpiozero.Button(22, bounce_time=0.5),    # charging station
+        ),
+        buttons={
+            "charge":    gpiozero.Button(2, bounce_time=0.5),
+            "discharge": gpiozero.Button(3, bounce_time=0.5),
+        },
+        led_rgb=led_rgb,
+        led_btn={
+            "charge":    gpiozero.LED(10),
+            "discharge": gpiozero.LED(11),
+        },
+        windmill=gpiozero.Servo(12, min_pulse_width=0.00149, max_pulse_width=0.0015),  # Adjust as needed
+        display=ScoreGUI(),
+    )
 
-# Initialize the GPIO pins for the sensors, buttons, LEDs, and windmill
-btn_charge = gpiozero.Button(2, bounce_time=0.5)
-btn_discharge = gpiozero.Button(3, bounce_time=0.5)
-park_office = gpiozero.Button(4, bounce_time=0.5)
-park_home = gpiozero.Button(17, bounce_time=0.5)
-park_shop = gpiozero.Button(27, bounce_time=0.5)
-park_charge = gpiozero.Button(22, bounce_time=0.5)
-windmill = gpiozero.Servo(12, min_pulse_width=0.00149, max_pulse_width=0.0015)  # Adjust as needed
-led_charge = gpiozero.LED(10)
-led_discharge = gpiozero.LED(11)
 
-if not init_leds(physical_leds=4):
-    print("LED initialization failed. Exiting.")
+# ---------- Replace the following stubs with real I/O code ---------- #
 
+_led_lit: List[int] = [0, 0]    # [red, green] masks the LEDs currently show
 
-# ---------- Replace the following stubs with real I/O code ---------- #
 
-def read_sensor(index: int) -> bool:
-    """Return *True* when the sensor line *index* is LOW (active)."""
-    if index == 0:
-        return park_office.is_pressed
-    elif index == 1:
-        return park_home.is_pressed
-    elif index == 2:
-        return park_shop.is_pressed
-    elif index == 3:
-        return park_charge.is_pressed
-
-
-def set_led(index: int, color: str, on: bool = True) -> None:
-    """Drive the RGB LED that belongs to *sensor index*."""
-    if index == 0:
-        off1()
-    elif index == 1:
-        off2()
-    elif index == 2:
-        off3()
-    elif index == 3:
-        off4()
-    else:
-        raise ValueError(f"Invalid sensor index: {index}")
-    
-    if on:
-        if color == "red":
-            if index == 0:
-                r1()
-            elif index == 1:
-                r2()
-            elif index == 2:
-                r3()
-            elif index == 3:
-                r4()
-            else:
-                raise ValueError(f"Invalid sensor index: {index}")
-        elif color == "green":
-            if index == 0:
-                g1()
-            elif index == 1:
-                g2()
-            elif index == 2:
-                g3()
-            elif index == 3:
-                g4()
-            else:
-                raise ValueError(f"Invalid sensor index: {index}")
-
-
-def read_button(name: str) -> bool:
+def set_all_leds(hw: HW, red_mask: int, green_mask: int) -> None:
+    """Drive all sensor LEDs in one go; bit *i* of a mask selects LED *i*.
+
+    LEDs that appear in neither mask are switched off, red wins over green.
+    Only LEDs whose colour differs from what ``_led_lit`` says is shown are
+    written.  This is the single entry point for LED output – swap in a
+    multi‑line write here once the LED driver offers one.
+    """
+    red_mask &= ALL_LEDS
+    green_mask &= ALL_LEDS & ~red_mask
+    lit_red, lit_green = _led_lit
+    changed = (red_mask ^ lit_red) | (green_mask ^ lit_green)
+    if not changed:
+        return
+    for idx, (off, red, green) in enumerate(hw.led_rgb):
+        if not changed >> idx & 1:
+            continue
+        off()
+        if red_mask >> idx & 1:
+            red()
+        elif green_mask >> idx & 1:
+            green()
+    _led_lit[:] = (red_mask, green_mask)
+
+
+def read_button(hw: HW, name: str) -> bool:
     """Return *True* while the named button is pressed."""
-    if name == "charge":
-        return btn_charge.is_pressed
-    elif name == "discharge":
-        return btn_discharge.is_pressed
+    return hw.buttons[name].is_pressed
 
 
-def set_button_led(name: str, on: bool) -> None:
+def set_button_led(hw: HW, name: str, on: bool) -> None:
     """Turn the integrated LED of a button on/off."""
-    if name == "charge":
-        if on:
-            led_charge.on()
-            display.highlight_laden(active=True)
-        else:
-            led_charge.off()
-            display.highlight_laden(active=False)
-    elif name == "discharge":
-        if on:
-            led_discharge.on()
-            display.highlight_entladen(active=True)
-        else:
-            led_discharge.off()
-            display.highlight_entladen(active=False)
+    led = hw.led_btn[name]
+    (led.on if on else led.off)()
+    _HIGHLIGHT[name](hw.display, active=on)
 
 
-def set_windmill(on: bool) -> None:
+def set_windmill(hw: HW, on: bool) -> None:
     """Spin (True) or stop (False) the miniature wind‑turbine."""
     if on:
-        windmill.max()
+        hw.windmill.max()
     else:
-        windmill.detach()  # stop spinning
+        hw.windmill.detach()  # stop spinning
 
 
-def update_score_display(score: int) -> None:
+def update_score_display(hw: HW, score: int) -> None:
     """Update the 4‑digit 7‑segment display (0000 … 9999)."""
-    display.set_score(score)
+    hw.display.set_score(score)
 
 
-def update_soc_display(level: int) -> None:
+def update_soc_display(hw: HW, level: int) -> None:
     """Show a level between 0 and 10 on the SoC bar graph."""
-    display.set_soc(level)
+    hw.display.set_soc(level)
 
 
 # --------------------------------------------------------------------------- #
@@ -171,35 +169,73 @@ def update_soc_display(level: int) -> None:
 # How many SoC levels are gained for sensors 0‑3 when “charging”.
 SOC_INCREMENT = (2, 3, 4, 2)          # tweak freely
 
+# Timings, kept as integer nanoseconds of ``time.monotonic_ns()``.
+COOLDOWN_NS   = 1_000_000_000         # same sensor may be used again after 1 s
+RESET_HOLD_NS = 3_000_000_000         # both buttons held this long → reset
+WINDMILL_NS   =   200_000_000         # turbine spin after every action
+
+
+class State(Enum):
+    """Phases of the game state machine (see ``TRANSITIONS`` below)."""
+    IDLE        = auto()    # dark, last score shown, waiting for a button
+    ARMED       = auto()    # round running, waiting for the next action
+    RESET_ARMED = auto()    # both buttons held, reset timer running
+    RESET_HELD  = auto()    # reset done, next round starts once both are up
+    ACTION      = auto()    # action taken, waiting for both buttons released
+
 
 class Game:
     """
-    Encapsulates one full game loop (idle <‑‑> play).
+    Encapsulates the game as an explicit state machine (idle <‑‑> play).
+    Every GPIO edge is one event and runs exactly one transition.
     A *Game* object can be re‑used indefinitely.
     """
 
-    # -------------------------------- Idle -------------------------------- #
+    # ----------------------------- Event loop ----------------------------- #
 
-    def idle(self) -> None:
-        """Idle loop — waits for any button press and keeps the last score."""
-        # Darken everything
-        for idx in range(NUM_SENSORS):
-            set_led(idx, "off", on=False)
-        set_button_led("charge", False)
-        set_button_led("discharge", False)
-        set_windmill(False)
+    def run(self) -> None:
+        """Dispatch GPIO events and due timers forever (power‑up default is idle mode)."""
+        self._enter_idle()
+        next_event, transition = self._events.get, TRANSITIONS.get   # bound once
+        while True:
+            timeout = None
+            if self._timers:
+                due = min(self._timers.values())
+                timeout = max(0, due - time.monotonic_ns()) / 1e9
+            try:
+                event = next_event(timeout=timeout)
+            except queue.Empty:                   # earliest timer is due
+                event = min(self._timers, key=self._timers.__getitem__)
+                del self._timers[event]
+            handler = transition((self.state, event))
+            if handler is not None:
+                handler(self)
+
+    def _on_sensor_edge(self, idx: int, level: int) -> None:
+        """gpiozero callback: record the sensor level, then wake run()."""
+        self._sensor_active[idx] = level      # single store, safe from any thread
+        self._events.put("sensor")
+
+    def _call_later(self, delay_ns: int, event: str) -> None:
+        """Dispatch *event* from run() once *delay_ns* has elapsed."""
+        self._timers[event] = time.monotonic_ns() + delay_ns
+
+    def _cancel(self, event: str) -> None:
+        """Drop a pending :meth:`_call_later` for *event*, if any."""
+        self._timers.pop(event, None)
 
-        update_score_display(self.score)          # show last score once more
+    # -------------------------------- Idle -------------------------------- #
 
-        # Block here until a button is pressed
-        while True:
-            if read_button("charge") or read_button("discharge"):
-                # debounce
-                while read_button("charge") or read_button("discharge"):
-                    time.sleep(0.01)
-                self._start_new_round()
-                return
-            time.sleep(0.02)
+    def _enter_idle(self) -> None:
+        """Darken everything, keep the last score and wait for any button."""
+        set_all_leds(self.hw, 0, 0)
+        set_button_led(self.hw, "charge", False)
+        set_button_led(self.hw, "discharge", False)
+        if "windmill_off" not in self._timers:   # a pending spin ends on its own
+            set_windmill(self.hw, False)
+
+        update_score_display(self.hw, self.score)  # show last score once more
+        self.state = State.IDLE
 
     # ------------------------------- Playing ------------------------------ #
 
@@ -207,53 +243,63 @@ class Game:
         self.actions             = 0
         self.soc                 = SOC_LEVELS // 2         # arbitrary start
         self.last_sensor         = None                    # last active index
-        self.last_action_ts      = [0.0] * NUM_SENSORS     # per‑sensor timer
+        for idx in range(NUM_SENSORS):                     # per‑sensor timer
+            self.last_action_ts[idx] = 0
         self._randomise_leds()
-        update_soc_display(self.soc)
+        update_soc_display(self.hw, self.soc)
+        self._refresh_button_leds()
 
-        self._play_round()        # enter main play loop
+        self.state = State.ACTION   # the starting press must be released first
 
-    def _play_round(self) -> None:
-        both_pressed_since: Optional[float] = None
-
-        while self.actions < MAX_ACTIONS:
-            active = self._get_active_sensor()
+    def _on_press(self, button: str) -> None:
+        """A button went down while the round is armed."""
+        # -------- Reset combo (both buttons ≥ 3 s) -------- #
+        if read_button(self.hw, "charge") and read_button(self.hw, "discharge"):
+            self._call_later(RESET_HOLD_NS, "reset_due")
+            self.state = State.RESET_ARMED
+            return
 
-            # enable / disable button illumination
-            any_active = active is not None
-            set_button_led("charge", any_active)
-            set_button_led("discharge", any_active)
+        # -------- Handle a user action -------- #
+        active = self._get_active_sensor()
+        if active is not None and self._handle_action(active, button):
+            self.state = State.ACTION
 
-            # -------- Reset combo (both buttons ≥ 3 s) -------- #
-            if read_button("charge") and read_button("discharge"):
-                if both_pressed_since is None:
-                    both_pressed_since = time.time()
-                elif time.time() - both_pressed_since >= 3.0:
-                    self._full_reset()
-                    return
-            else:
-                both_pressed_since = None  # combo broken
+    def _on_release(self) -> None:
+        """Accept the next action only once *both* buttons are up again."""
+        if read_button(self.hw, "charge") or read_button(self.hw, "discharge"):
+            return
+        if self.actions >= MAX_ACTIONS:
+            self._enter_idle()      # round finished → back to idle
+        else:
+            self.state = State.ARMED
 
-            # -------- Handle a user action -------- #
-            if active is not None:
-                if read_button("charge"):
-                    self._handle_action(active, "charge")
-                elif read_button("discharge"):
-                    self._handle_action(active, "discharge")
+    def _on_reset_release(self) -> None:
+        """After a combo reset, start the next round once *both* buttons are up."""
+        if read_button(self.hw, "charge") or read_button(self.hw, "discharge"):
+            return
+        self._start_new_round()
+        self.state = State.ARMED    # the starting press is already released
 
-            time.sleep(0.01)      # 100 Hz polling
+    def _disarm_reset(self) -> None:
+        """One of the buttons was let go before the 3 s were up."""
+        self._cancel("reset_due")
+        self.state = State.ARMED
 
-        # round finished → back to idle
-        self.idle()
+    def _refresh_button_leds(self) -> None:
+        """Light both buttons while at least one sensor is active."""
+        any_active = self._get_active_sensor() is not None
+        set_button_led(self.hw, "charge", any_active)
+        set_button_led(self.hw, "discharge", any_active)
 
     # -------------------------- Action Processing ------------------------- #
 
-    def _handle_action(self, sensor_idx: int, button: str) -> None:
-        now = time.time()
+    def _handle_action(self, sensor_idx: int, button: str) -> bool:
+        """Score one action; return *False* if the sensor is still cooling down."""
+        now = time.monotonic_ns()
 
         # enforce 1 s minimum delay for *same* sensor
-        if now - self.last_action_ts[sensor_idx] < 1.0:
-            return
+        if now - self.last_action_ts[sensor_idx] < COOLDOWN_NS:
+            return False
         self.last_action_ts[sensor_idx] = now
 
         led_value   = self.led_values[sensor_idx]          # 0 / 1 on that LED
@@ -285,55 +331,92 @@ class Game:
         self.score += score_delta
         self.soc    = max(0, min(SOC_LEVELS, self.soc + soc_change))
 
-        update_score_display(self.score)
-        update_soc_display(self.soc)
+        update_score_display(self.hw, self.score)
+        update_soc_display(self.hw, self.soc)
 
         # visual feedback
         self._spin_windmill_briefly()
 
         # prepare next turn
         self._randomise_leds()
-
-        # wait until the button is released (simple debounce)
-        while read_button("charge") or read_button("discharge"):
-            time.sleep(0.01)
+        return True
 
     # ------------------------------ Helpers ------------------------------- #
 
     def _get_active_sensor(self) -> Optional[int]:
         """Return index of the *first* low‑active sensor, or *None*."""
-        for idx in range(NUM_SENSORS):
-            if read_sensor(idx):
-                return idx
-        return None
+        idx = self._sensor_active.find(1)
+        return None if idx < 0 else idx
 
     def _randomise_leds(self) -> None:
         """Assign a fresh random 0/1 to every sensor LED."""
-        self.led_values = [random.randint(0, 1) for _ in range(NUM_SENSORS)]
-        for idx, val in enumerate(self.led_values):
-            set_led(idx, LED_COLOR[val], on=True)
+        bits = self._rng.getrandbits(NUM_SENSORS)          # bit i = LED i
+        for idx in range(NUM_SENSORS):
+            self.led_values[idx] = (bits >> idx) & 1
+        set_all_leds(self.hw, ~bits & ALL_LEDS, bits)   # 0 red, 1 green
 
-    @staticmethod
-    def _spin_windmill_briefly() -> None:
-        """Spin the turbine for ~200 ms as a little effect."""
-        set_windmill(True)
-        time.sleep(0.2)
-        set_windmill(False)
+    def _spin_windmill_briefly(self) -> None:
+        """Spin the turbine for ~200 ms as a little effect (without blocking)."""
+        set_windmill(self.hw, True)
+        self._call_later(WINDMILL_NS, "windmill_off")   # re‑spins extend the run
+
+    def _stop_windmill(self) -> None:
+        set_windmill(self.hw, False)
 
     def _full_reset(self) -> None:
         """Hard reset (triggered by 3 s button combo)."""
         self.score = 0
-        self.idle()
+        self._enter_idle()
+        self.state = State.RESET_HELD   # letting go starts a new round
 
     # ---------------------------- Construction ---------------------------- #
 
-    def __init__(self) -> None:
+    def __init__(self, hw: HW) -> None:
+        self.hw            = hw
         self.score         = 0                # persists across rounds
         self.actions       = 0
         self.soc           = SOC_LEVELS // 2
         self.last_sensor   = None
-        self.last_action_ts: List[float] = [0.0] * NUM_SENSORS
-        self.led_values:   List[int]   = [0] * NUM_SENSORS
+        # preallocated once, mutated in place for every round / action
+        self.last_action_ts = array("q", [0] * NUM_SENSORS)     # monotonic_ns
+        self.led_values     = bytearray(NUM_SENSORS)
+        self.state         = State.IDLE
+        self._rng          = random.Random()
+        self._timers:      Dict[str, int] = {}    # event → monotonic_ns due
+
+        # Edge notifications.  gpiozero delivers these from its own callback
+        # thread (driven by the kernel's GPIO interrupt interface); run() takes
+        # them off this queue one at a time, so it never polls the lines.
+        self._events: queue.Queue[str] = queue.Queue()
+        for name, btn in hw.buttons.items():
+            btn.when_pressed = partial(self._events.put, f"{name}_down")
+            btn.when_released = partial(self._events.put, f"{name}_up")
+        self._sensor_active = bytearray(NUM_SENSORS)    # 1 while sensor i is LOW
+        for idx, sensor in enumerate(hw.sensors):
+            sensor.when_pressed = partial(self._on_sensor_edge, idx, 1)
+            sensor.when_released = partial(self._on_sensor_edge, idx, 0)
+            self._sensor_active[idx] = sensor.is_pressed
+
+
+# (state, event) → transition.  Events without an entry are ignored.
+TRANSITIONS: Dict[Tuple[State, str], Callable[[Game], None]] = {
+    (State.IDLE,        "charge_down"):    Game._start_new_round,
+    (State.IDLE,        "discharge_down"): Game._start_new_round,
+    (State.ARMED,       "charge_down"):    lambda game: game._on_press("charge"),
+    (State.ARMED,       "discharge_down"): lambda game: game._on_press("discharge"),
+    (State.ARMED,       "sensor"):         Game._refresh_button_leds,
+    (State.RESET_ARMED, "charge_up"):      Game._disarm_reset,
+    (State.RESET_ARMED, "discharge_up"):   Game._disarm_reset,
+    (State.RESET_ARMED, "reset_due"):      Game._full_reset,
+    (State.RESET_ARMED, "sensor"):         Game._refresh_button_leds,
+    (State.RESET_HELD,  "charge_up"):      Game._on_reset_release,
+    (State.RESET_HELD,  "discharge_up"):   Game._on_reset_release,
+    (State.ACTION,      "charge_up"):      Game._on_release,
+    (State.ACTION,      "discharge_up"):   Game._on_release,
+    (State.ACTION,      "sensor"):         Game._refresh_button_leds,
+}
+for _state in State:                    # events handled the same in every state
+    TRANSITIONS[_state, "windmill_off"] = Game._stop_windmill
 
 
 # --------------------------------------------------------------------------- #
@@ -341,17 +424,21 @@ class Game:
 # --------------------------------------------------------------------------- #
 
 def main() -> None:
-    game = Game()
+    hw = build_hw()
+    game = Game(hw)
+
+    # Tk owns the main thread; the game only blocks on its event queue and
+    # hands every GUI change to the display's thread‑safe setters.
+    threading.Thread(target=game.run, daemon=True, name="GameThread").start()
     try:
-        while True:          # power‑up default is idle mode
-            game.idle()
+        hw.display.mainloop()     # returns when the window is closed
     except KeyboardInterrupt:
-        # Graceful exit in a development environment
-        for idx in range(NUM_SENSORS):
-            set_led(idx, "off", on=False)
-        set_button_led("charge", False)
-        set_button_led("discharge", False)
-        set_windmill(False)
+        pass                      # Ctrl‑C in a development environment
+    finally:
+        set_all_leds(hw, 0, 0)
+        for led in hw.led_btn.values():
+            led.off()
+        set_windmill(hw, False)
         cleanup()
 
 
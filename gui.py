@@ -1,9 +1,13 @@
+import threading
 import tkinter as tk
 from tkinter import ttk
 
 BLUE      = "#1976d2"   # “LADEN” background
 YELLOW_DK = "#cc9900"   # “ENTLADEN” background
 
+# Pre‑formatted score strings for the 4‑digit range (index = score)
+_SCORE_STR = tuple(f"{i:04d}" for i in range(10000))
+
 
 class BatteryCanvas(tk.Canvas):
     """A scalable, 10‑segment battery visualization that redraws on resize."""
@@ -12,21 +16,42 @@ class BatteryCanvas(tk.Canvas):
         super().__init__(master, highlightthickness=0, *args, **kwargs)
         self.segments = segments
         self.level = 0  # 0‑segments (int)
-        self.bind("<Configure>", lambda ev: self._redraw())
+
+        # Canvas items are created once and only moved / recoloured later
+        self._outline_id = self.create_rectangle(0, 0, 1, 1, width=3)
+        self._tip_id = self.create_rectangle(0, 0, 1, 1, width=3)
+        self._seg_ids = [self.create_rectangle(0, 0, 1, 1, width=0)
+                         for _ in range(segments)]
+        self._last_level = None
+        self._last_wh = None
+        self._redraw_after = None  # pending trailing‑edge resize redraw
+        self.bind("<Configure>", self._schedule_redraw)
 
     # ------- Public API -------------------------------------------------
     def set_level(self, level: int) -> None:
         """Clamp *level* to 0…segments and refresh the drawing."""
-        self.level = max(0, min(level, self.segments))
+        level = max(0, min(level, self.segments))
+        if level == self.level:
+            return  # unchanged – nothing to redraw
+        self.level = level
         self._redraw()
 
     # ------- Internal helpers ------------------------------------------
+    def _schedule_redraw(self, event=None) -> None:
+        """Debounce resize storms: only the last <Configure> within 30 ms draws."""
+        if self._redraw_after is not None:
+            self.after_cancel(self._redraw_after)
+        self._redraw_after = self.after(30, self._redraw)
+
     def _redraw(self) -> None:
-        """Redraw the whole battery each time the widget is resized or level changes."""
-        self.delete("all")
+        """Update the battery items each time the widget is resized or level changes."""
+        self._redraw_after = None
         w, h = self.winfo_width(), self.winfo_height()
         if w <= 1 or h <= 1:  # geometry not yet calculated
             return
+        if self.level == self._last_level and (w, h) == self._last_wh:
+            return  # nothing changed
+        self._last_level, self._last_wh = self.level, (w, h)
 
         body_margin = min(w, h) * 0.05
         body_h = h * 0.9
@@ -37,20 +62,20 @@ class BatteryCanvas(tk.Canvas):
         x1, y1 = x0 + body_w, y0 + body_h
 
         # Battery outline
-        self.create_rectangle(x0, y0, x1, y1, width=3)
+        self.coords(self._outline_id, x0, y0, x1, y1)
         # Battery tip
         tip_w = body_w * 0.4
         tip_x0 = (w - tip_w) / 2
-        self.create_rectangle(tip_x0, y0, tip_x0 + tip_w, y0 - tip_h, width=3)
+        self.coords(self._tip_id, tip_x0, y0, tip_x0 + tip_w, y0 - tip_h)
 
-        # Segments (draw bottom‑up)
+        # Segments (bottom‑up)
         seg_h = body_h / self.segments
-        for i in range(self.segments):
+        for i, seg_id in enumerate(self._seg_ids):
             seg_y0 = y1 - seg_h * (i + 1)
             seg_y1 = y1 - seg_h * i
             fill_colour = "#22aa22" if i < self.level else ""
-            self.create_rectangle(x0 + 4, seg_y0 + 4, x1 - 4, seg_y1 - 4,
-                                   width=0, fill=fill_colour)
+            self.coords(seg_id, x0 + 4, seg_y0 + 4, x1 - 4, seg_y1 - 4)
+            self.itemconfigure(seg_id, fill=fill_colour)
 
 
 class ScoreGUI(tk.Tk):
@@ -100,34 +125,79 @@ class ScoreGUI(tk.Tk):
         self.laden_lbl.pack(side="left", padx=(0, 20))
         self.entl_lbl.pack(side="left")
 
-        # --- Public API --------------------------------------------------
+        # Highlight colours are fixed – ask Tk once instead of on every toggle
+        self._laden_fg = self.laden_lbl.cget("fg")
+        self._laden_bg = self.laden_lbl.cget("background")
+        self._entl_fg = self.entl_lbl.cget("fg")
+        self._entl_bg = self.entl_lbl.cget("background")
+
+        # Pending updates (key → latest value), written by any thread and
+        # applied in one batch on the Tk thread every 16 ms (~60 Hz).
+        self._pending = {}
+        self._applied = {}
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self.after(16, self._flush)
+
+        # --- Public API (thread‑safe) -----------------------------------
     def set_score(self, value: int) -> None:
         """Update 4‑digit, zero‑padded score."""
-        self._score_var.set(f"{value:04d}")
+        self._post("score", value)
 
     def set_soc(self, level: int) -> None:
         """Update state‑of‑charge (0‑10)."""
-        self.battery.set_level(level)
+        self._post("soc", level)
 
     #  Highlight helpers -------------------------------------------------
     def highlight_laden(self, active: bool = True) -> None:
         """Turn highlighting for the LADEN label on or off."""
-        self._set_highlight(self.laden_lbl, active)
+        self._post("laden", active)
         #if active:
         #    self.highlight_entladen(False)  # optional mutual exclusion
 
     def highlight_entladen(self, active: bool = True) -> None:
         """Turn highlighting for the ENTLADEN label on or off."""
-        self._set_highlight(self.entl_lbl, active)
+        self._post("entladen", active)
         if active:
             self.highlight_laden(False)
 
-    def _set_highlight(self, label: tk.Label, active: bool) -> None:
+    # ------- Update batching (called from any thread) ------------------
+    def _post(self, key: str, value) -> None:
+        """Record *value* for *key*; only the latest one per flush is drawn."""
+        with self._lock:
+            self._pending[key] = value
+        self._dirty.set()
+
+    # ------- Update batching (runs on the Tk thread) --------------------
+    def _flush(self) -> None:
+        """Apply pending updates whose value actually changed, then re‑arm."""
+        if self._dirty.is_set():
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._dirty.clear()
+            for key, value in pending.items():
+                if key in self._applied and self._applied[key] == value:
+                    continue
+                self._applied[key] = value
+                getattr(self, f"_apply_{key}")(value)
+        self.after(16, self._flush)
+
+    def _apply_score(self, value: int) -> None:
+        self._score_var.set(_SCORE_STR[value] if 0 <= value < 10000 else f"{value:04d}")
+
+    def _apply_soc(self, level: int) -> None:
+        self.battery.set_level(level)
+
+    def _apply_laden(self, active: bool) -> None:
+        self._set_highlight(self.laden_lbl, active, self._laden_fg, self._laden_bg)
+
+    def _apply_entladen(self, active: bool) -> None:
+        self._set_highlight(self.entl_lbl, active, self._entl_fg, self._entl_bg)
+
+    def _set_highlight(self, label: tk.Label, active: bool, fg: str, bg: str) -> None:
         """Apply or remove a bold border around *label* as the highlight."""
-        if active:
-            label.config(relief="flat", highlightbackground=label.cget("fg"), highlightcolor=label.cget("fg"), highlightthickness=2)
-        else:
-            label.config(relief="flat", highlightbackground=label.cget("background"), highlightcolor=label.cget("background"), highlightthickness=2)
+        colour = fg if active else bg
+        label.config(relief="flat", highlightbackground=colour, highlightcolor=colour, highlightthickness=2)
 
     # # Demo loop (remove when integrating) -------------------------------
     # def _demo_tick(self):
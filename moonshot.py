@@ -6,10 +6,10 @@ The script …
 * starts the GPIO‑based game logic in a background thread
 
 Running the file pops up the window immediately while the game loop
-keeps polling the hardware and updating the GUI.
+reacts to GPIO edges and updates the GUI.
 
-⚠️ Thread‑safety: All calls that *touch* Tk widgets are marshalled back to
-   the GUI thread via `display.after(0, …)`.
+⚠️ Thread‑safety: All calls that *touch* Tk widgets are queued and applied
+   by the GUI thread in one batch every 16 ms (see `_gui_call`).
    Hardware I/O (GPIO, LEDs, wind‑mill) is still performed in the worker
    thread.
 
@@ -19,12 +19,16 @@ Adjust the GPIO pin numbers / LED helpers for your hardware if needed.
 ###########################################################################
 #                                 Imports                                 #
 ###########################################################################
+import queue
 import random
+import subprocess
 import threading
 import time
+from functools import partial
 from typing import List, Optional
 
 import gpiozero  # sudo pip install gpiozero
+from gpiozero.pins.pigpio import PiGPIOFactory  # sudo apt install pigpio
 from led_controller import (
     init_leds,
     g1,
@@ -49,6 +53,7 @@ from tkinter import ttk
 ###########################################################################
 BLUE = "#1976d2"  # “LADEN” label colour
 YELLOW_DK = "#cc9900"  # “ENTLADEN” label colour
+_SCORE_STR = tuple(f"{i:04d}" for i in range(10000))  # 4‑digit score texts
 
 
 class BatteryCanvas(tk.Canvas):
@@ -58,16 +63,19 @@ class BatteryCanvas(tk.Canvas):
         super().__init__(master, highlightthickness=0, *args, **kwargs)
         self.segments = segments
         self.level = 0  # 0‑segments (int)
-        self.bind("<Configure>", lambda ev: self._redraw())
+        # Canvas item ids, created on the first <Configure> and reused after
+        self._outline_id = self._tip_id = None
+        self._seg_ids: List[int] = []
+        self.bind("<Configure>", lambda ev: self._rebuild_geometry())
 
     # --------------------------- Public API --------------------------- #
     def set_level(self, level: int) -> None:
         self.level = max(0, min(level, self.segments))
-        self._redraw()
+        self._apply_level()
 
     # ------------------------ Internal helpers ------------------------ #
-    def _redraw(self) -> None:
-        self.delete("all")
+    def _rebuild_geometry(self) -> None:
+        """Create the battery items once, then only move them on resize."""
         w, h = self.winfo_width(), self.winfo_height()
         if w <= 1 or h <= 1:
             return  # geometry not yet available
@@ -80,22 +88,32 @@ class BatteryCanvas(tk.Canvas):
         x0, y0 = (w - body_w) / 2, (h - body_h) / 2
         x1, y1 = x0 + body_w, y0 + body_h
 
+        if self._outline_id is None:
+            self._outline_id = self.create_rectangle(0, 0, 0, 0, width=3)
+            self._tip_id = self.create_rectangle(0, 0, 0, 0, width=3)
+            self._seg_ids = [
+                self.create_rectangle(0, 0, 0, 0, width=0) for _ in range(self.segments)
+            ]
+
         # Battery outline
-        self.create_rectangle(x0, y0, x1, y1, width=3)
+        self.coords(self._outline_id, x0, y0, x1, y1)
         # Battery tip
         tip_w = body_w * 0.4
         tip_x0 = (w - tip_w) / 2
-        self.create_rectangle(tip_x0, y0, tip_x0 + tip_w, y0 - tip_h, width=3)
+        self.coords(self._tip_id, tip_x0, y0, tip_x0 + tip_w, y0 - tip_h)
 
-        # Segments (draw bottom‑up)
+        # Segments (bottom‑up)
         seg_h = body_h / self.segments
-        for i in range(self.segments):
+        for i, seg_id in enumerate(self._seg_ids):
             seg_y0 = y1 - seg_h * (i + 1)
             seg_y1 = y1 - seg_h * i
-            fill_colour = "#22aa22" if i < self.level else ""
-            self.create_rectangle(
-                x0 + 4, seg_y0 + 4, x1 - 4, seg_y1 - 4, width=0, fill=fill_colour
-            )
+            self.coords(seg_id, x0 + 4, seg_y0 + 4, x1 - 4, seg_y1 - 4)
+        self._apply_level()
+
+    def _apply_level(self) -> None:
+        """Recolour the cached segments to show the current level."""
+        for i, seg_id in enumerate(self._seg_ids):
+            self.itemconfigure(seg_id, fill="#22aa22" if i < self.level else "")
 
 
 class ScoreGUI(tk.Tk):
@@ -122,14 +140,15 @@ class ScoreGUI(tk.Tk):
         right.rowconfigure(0, weight=1)
 
         # Score label --------------------------------------------------
-        self._score_var = tk.StringVar(value="0000")
-        ttk.Label(
+        self._last_score = 0
+        self._score_lbl = ttk.Label(
             right,
-            textvariable=self._score_var,
+            text=_SCORE_STR[0],
             font=("Courier", 96, "bold"),
             anchor="center",
             justify="center",
-        ).grid(row=0, column=0)
+        )
+        self._score_lbl.grid(row=0, column=0)
 
         # Status labels container -------------------------------------
         status = ttk.Frame(right)
@@ -141,11 +160,41 @@ class ScoreGUI(tk.Tk):
         self.laden_lbl.pack(side="left", padx=(0, 20))
         self.entl_lbl.pack(side="left")
 
+        # Highlight configs per label: (off, on), built once from its colours
+        self._hl_styles = {
+            lbl: self._highlight_styles(lbl) for lbl in (self.laden_lbl, self.entl_lbl)
+        }
+        self._hl_active = {self.laden_lbl: None, self.entl_lbl: None}
+
+        self.after(16, self._drain_ui)
+
+    # ------------------------ Cross‑thread updates -------------------- #
+    def _drain_ui(self) -> None:
+        """Apply queued GUI calls; only the latest call per function is run."""
+        if not _ui_q.empty():  # most ticks have nothing to do
+            latest = {}
+            while True:
+                try:
+                    func, args = _ui_q.get_nowait()
+                except queue.Empty:
+                    break
+                latest[func] = args
+            for func, args in latest.items():
+                func(*args)
+        self.after(16, self._drain_ui)  # ~60 Hz
+
     # --------------------------- Public API --------------------------- #
     def set_score(self, value: int) -> None:
-        self._score_var.set(f"{value:04d}")
+        if value == self._last_score:
+            return  # skip the 96 pt relayout for an unchanged score
+        self._last_score = value
+        self._score_lbl.configure(
+            text=_SCORE_STR[value] if 0 <= value < 10000 else f"{value:04d}"
+        )
 
     def set_soc(self, level: int) -> None:
+        if level == self.battery.level:
+            return
         self.battery.set_level(level)
 
     # ------------------------ Highlight helpers ----------------------- #
@@ -156,13 +205,23 @@ class ScoreGUI(tk.Tk):
         self._set_highlight(self.entl_lbl, active)
 
     def _set_highlight(self, label: tk.Label, active: bool) -> None:
-        cfg = {
-            "relief": "flat",
-            "highlightbackground": label.cget("fg") if active else label.cget("background"),
-            "highlightcolor": label.cget("fg") if active else label.cget("background"),
-            "highlightthickness": 2 if active else 2,
-        }
-        label.config(**cfg)
+        if self._hl_active[label] == active:
+            return
+        self._hl_active[label] = active
+        label.config(**self._hl_styles[label][active])
+
+    @staticmethod
+    def _highlight_styles(label: tk.Label) -> tuple:
+        fg, bg = label.cget("fg"), label.cget("background")
+        return tuple(
+            {
+                "relief": "flat",
+                "highlightbackground": colour,
+                "highlightcolor": colour,
+                "highlightthickness": 2,
+            }
+            for colour in (bg, fg)
+        )
 
 
 ###########################################################################
@@ -173,7 +232,23 @@ NUM_SENSORS = 4
 SOC_LEVELS = 10
 MAX_ACTIONS = 10
 BUTTONS = ("charge", "discharge")
-LED_COLOR = {0: "red", 1: "green"}
+
+# --- Pin factory ----------------------------------------------------
+# pigpiod samples all GPIOs via DMA and debounces in the daemon, so the
+# Buttons only wake Python on real edges instead of each spinning a
+# polling thread. Must be set before the first device is created.
+
+def _pigpio_factory() -> PiGPIOFactory:
+    """Connect to pigpiod, starting the daemon first if it is not running."""
+    try:
+        return PiGPIOFactory()
+    except OSError:
+        subprocess.run(["pigpiod"], check=False)  # needs root
+        time.sleep(1.0)  # give the daemon a moment to open its socket
+        return PiGPIOFactory()
+
+
+gpiozero.Device.pin_factory = _pigpio_factory()
 
 # --- GPIO objects ---------------------------------------------------
 btn_charge = gpiozero.Button(2, bounce_time=0.05)
@@ -186,45 +261,89 @@ windmill = gpiozero.Servo(10, min_pulse_width=0.00149, max_pulse_width=0.0015)
 led_charge = gpiozero.LED(9)
 led_discharge = gpiozero.LED(11)
 
+_SENSORS = (park_office, park_home, park_shop, park_charge)
+_BTNS = {"charge": btn_charge, "discharge": btn_discharge}
+
+# pigpio connection behind the pin factory: one read_bank_1() returns the
+# levels of GPIO 0‑31 at once. Sensors and buttons are active LOW.
+_pi = gpiozero.Device.pin_factory.connection
+_SENSOR_BITS = tuple(s.pin.number for s in _SENSORS)  # same order as _SENSORS
+_SENSOR_MASK = sum(1 << bit for bit in _SENSOR_BITS)
+_BTN_MASK = sum(1 << b.pin.number for b in _BTNS.values())  # charge / discharge
+
+# --- Edge events ----------------------------------------------------
+# gpiozero fires the callbacks from its own thread; they only queue a
+# (kind, monotonic_ns) tuple, so a press registers on its leading edge
+# and the game thread never polls the pins or spins waiting for release.
+# kind: "charge" / "discharge" (press), "release", "sensor".
+_events: queue.Queue = queue.Queue()
+
+
+def _post(kind: str) -> None:
+    _events.put((kind, time.monotonic_ns()))
+
+
+for _name, _btn in _BTNS.items():
+    _btn.when_pressed = partial(_post, _name)
+    _btn.when_released = partial(_post, "release")
+for _sensor in _SENSORS:
+    _sensor.when_pressed = partial(_post, "sensor")
+    _sensor.when_released = partial(_post, "sensor")
+
 if not init_leds(physical_leds=4):
     raise RuntimeError("LED initialisation failed. Check wiring and pin‑numbers.")
 
 # The **display** instance is created *once* and shared across the module.
-# All GUI‑updates from other threads are marshalled via display.after.
+# All GUI‑updates from other threads go through _ui_q, drained by the display.
+_ui_q: queue.Queue = queue.Queue()
 display = ScoreGUI()
 
-def _gui_call(func, *args, **kwargs):
-    """Schedule *func* to run in the Tk/GUI thread ASAP."""
-    display.after(0, lambda: func(*args, **kwargs))
+def _gui_call(func, *args):
+    """Queue *func* to run in the Tk/GUI thread with the next batch."""
+    _ui_q.put((func, args))
 
 
 # ---------- Sensor helpers ------------------------------------------ #
 
-def read_sensor(index: int) -> bool:
-    """Return *True* if sensor *index* is LOW (active)."""
-    mapping = [park_office, park_home, park_shop, park_charge]
-    return mapping[index].is_pressed
+_LED_OFF = (off1, off2, off3, off4)
+_LED_RED = (r1, r2, r3, r4)
+_LED_GREEN = (g1, g2, g3, g4)
+_LED_ON = (_LED_RED, _LED_GREEN)  # indexed by LED value: 0 = red, 1 = green
+# What each LED currently shows: its value, None = off, -1 = not yet known
+_led_state: List[Optional[int]] = [-1] * NUM_SENSORS
+
 
+def read_sensors() -> int:
+    """Bitmask of active (LOW) sensor lines from a single bank read."""
+    return ~_pi.read_bank_1() & _SENSOR_MASK
 
-def set_led(index: int, color: str, on: bool = True) -> None:
-    """Drive the RGB LED attached to *sensor index*."""
-    off_funcs = [off1, off2, off3, off4]
-    on_funcs_red = [r1, r2, r3, r4]
-    on_funcs_green = [g1, g2, g3, g4]
 
-    off_funcs[index]()  # always blank first
+def set_led(index: int, value: int = 0, on: bool = True) -> None:
+    """Drive the RGB LED attached to *sensor index* (value 0 = red, 1 = green)."""
+    state = value if on else None
+    if _led_state[index] == state:
+        return  # already showing this – skip the GPIO writes
+    _led_state[index] = state
+    _LED_OFF[index]()  # always blank first
     if on:
-        (on_funcs_red if color == "red" else on_funcs_green)[index]()
+        _LED_ON[value][index]()
 
 
 # ---------- Button helpers ------------------------------------------ #
 
-def read_button(name: str) -> bool:  # charge / discharge
-    return btn_charge.is_pressed if name == "charge" else btn_discharge.is_pressed
+def buttons_held() -> int:
+    """Bitmask of held buttons (``_BTN_MASK`` = both) from a single bank read."""
+    return ~_pi.read_bank_1() & _BTN_MASK
+
+
+_btn_led_state = {"charge": None, "discharge": None}  # last state set per button
 
 
 def set_button_led(name: str, on: bool) -> None:
     """Switch integrated LED and highlight label."""
+    if _btn_led_state[name] == on:
+        return  # unchanged – no GPIO write, no GUI call
+    _btn_led_state[name] = on
 
     if name == "charge":
         (led_charge.on if on else led_charge.off)()
@@ -256,30 +375,62 @@ def update_soc_display(level: int) -> None:
 # SoC gain per sensor when *charging*
 SOC_INCREMENT = (2, 3, 4, 2)
 
+# (score_delta, soc_change) indexed by (led_value << 1) | is_discharge;
+# a soc_change of None means "use SOC_INCREMENT[sensor]"
+_DELTA_TABLE = (
+    (5, None),  # RED   + charge
+    (100, -1),  # RED   + discharge
+    (50, None),  # GREEN + charge
+    (5, 0),  # GREEN + discharge
+)
+
+# Same-sensor cooldown, in time.monotonic_ns() units
+COOLDOWN_NS = 1_000_000_000
+# Both buttons held this long reset the game
+RESET_HOLD_NS = 3_000_000_000
+# Wind‑mill spin after every action
+WINDMILL_NS = 200_000_000
+
 
 class Game:
     """Encapsulates one full game session (idle <‑‑> play)."""
 
+    __slots__ = (
+        "score",
+        "actions",
+        "soc",
+        "last_sensor",
+        "next_allowed_ns",
+        "led_values",
+        "_windmill_off_ns",
+        "_last_any_active",
+    )
+
     # ----------------------------- Idle ------------------------------ #
 
     def idle(self) -> None:
         """Idle loop – waits for a button press and shows last score."""
         for idx in range(NUM_SENSORS):
-            set_led(idx, "off", on=False)
+            set_led(idx, on=False)
         set_button_led("charge", False)
         set_button_led("discharge", False)
+        if self._windmill_off_ns is not None:  # let the last action's spin finish
+            time.sleep(max(0, self._windmill_off_ns - time.monotonic_ns()) / 1e9)
         set_windmill(False)
+        self._windmill_off_ns = None
 
         update_score_display(self.score)
 
+        # drop edges left over from the last round, then wait for a press
         while True:
-            if read_button("charge") or read_button("discharge"):
-                # debounce until release
-                while read_button("charge") or read_button("discharge"):
-                    time.sleep(0.01)
-                self._start_new_round()
-                return
-            time.sleep(0.02)
+            try:
+                _events.get_nowait()
+            except queue.Empty:
+                break
+        if not buttons_held():
+            while _events.get()[0] not in BUTTONS:
+                pass
+        self._start_new_round()
 
     # --------------------------- Playing ---------------------------- #
 
@@ -287,64 +438,86 @@ class Game:
         self.actions = 0
         self.soc = SOC_LEVELS // 2
         self.last_sensor: Optional[int] = None
-        self.last_action_ts = [0.0] * NUM_SENSORS
+        self.next_allowed_ns = [0] * NUM_SENSORS
+        self._last_any_active: Optional[bool] = None
         self._randomise_leds()
         update_soc_display(self.soc)
         self._play_round()
 
     def _play_round(self) -> None:
-        both_pressed_since: Optional[float] = None
+        reset_deadline: Optional[int] = None  # monotonic_ns, armed while both held
+        # A press only counts once every button is up again; this covers
+        # the press that started the round and the one behind each action.
+        in_flight = buttons_held()
 
         while self.actions < MAX_ACTIONS:
             active = self._get_active_sensor()
             any_active = active is not None
-            set_button_led("charge", any_active)
-            set_button_led("discharge", any_active)
-
-            # Reset combo (≥3 s both pressed)
-            if read_button("charge") and read_button("discharge"):
-                if both_pressed_since is None:
-                    both_pressed_since = time.time()
-                elif time.time() - both_pressed_since >= 3.0:
+            if any_active != self._last_any_active:  # only write on transitions
+                set_button_led("charge", any_active)
+                set_button_led("discharge", any_active)
+                self._last_any_active = any_active
+
+            # Sleep until the next edge or the nearest armed deadline; with
+            # nothing armed the thread blocks until the next edge.
+            next_wakeup = reset_deadline
+            windmill_off = self._windmill_off_ns
+            if windmill_off is not None and (next_wakeup is None or windmill_off < next_wakeup):
+                next_wakeup = windmill_off
+            remaining = None
+            if next_wakeup is not None:
+                remaining = max(0, next_wakeup - time.monotonic_ns()) / 1e9
+            try:
+                kind, ts = _events.get(timeout=remaining)
+            except queue.Empty:
+                kind, ts = "deadline", next_wakeup
+
+            self._stop_windmill_if_due()
+            if reset_deadline is not None and time.monotonic_ns() >= reset_deadline:
+                reset_deadline = None
+                if buttons_held() == _BTN_MASK:
                     self._full_reset()
                     return
-            else:
-                both_pressed_since = None
-
-            if active is not None:
-                if read_button("charge"):
-                    self._handle_action(active, "charge")
-                elif read_button("discharge"):
-                    self._handle_action(active, "discharge")
 
-            time.sleep(0.01)
+            if kind == "release":
+                reset_deadline = None
+                if not buttons_held():
+                    in_flight = False
+            elif kind in BUTTONS:
+                # Reset combo (≥3 s both pressed) – deadline armed on press, cleared on release
+                if buttons_held() == _BTN_MASK:
+                    if reset_deadline is None:
+                        reset_deadline = ts + RESET_HOLD_NS
+                elif not in_flight:
+                    active = self._get_active_sensor()
+                    if active is not None:
+                        in_flight = True
+                        self._handle_action(active, kind, ts)
+
+        # Round complete: the button behind the last action may still be
+        # down – wait for it so idle() waits for a fresh press.
+        while buttons_held():
+            off = self._windmill_off_ns
+            remaining = None if off is None else max(0, off - time.monotonic_ns()) / 1e9
+            try:
+                _events.get(timeout=remaining)
+            except queue.Empty:
+                pass
+            self._stop_windmill_if_due()
         self.idle()
 
     # ------------------------ Action processing ---------------------- #
 
-    def _handle_action(self, sensor_idx: int, button: str) -> None:
-        now = time.time()
-        if now - self.last_action_ts[sensor_idx] < 1.0:
+    def _handle_action(self, sensor_idx: int, button: str, now: int) -> None:
+        """Score a press of *button* at *now* (monotonic_ns) on *sensor_idx*."""
+        if now < self.next_allowed_ns[sensor_idx]:
             return  # same sensor cooldown
-        self.last_action_ts[sensor_idx] = now
-
-        led_value = self.led_values[sensor_idx]
-        soc_change = 0
-        score_delta = 0
-
-        if led_value == 0:  # RED
-            if button == "charge":
-                score_delta = 5
-                soc_change = SOC_INCREMENT[sensor_idx]
-            else:  # discharge
-                score_delta = 100
-                soc_change = -1
-        else:  # GREEN
-            if button == "charge":
-                score_delta = 50
-                soc_change = SOC_INCREMENT[sensor_idx]
-            else:  # discharge
-                score_delta = 5
+        self.next_allowed_ns[sensor_idx] = now + COOLDOWN_NS
+
+        led_value = (self.led_values >> sensor_idx) & 1
+        score_delta, soc_change = _DELTA_TABLE[(led_value << 1) | (button == "discharge")]
+        if soc_change is None:
+            soc_change = SOC_INCREMENT[sensor_idx]
 
         if self.last_sensor is not None and self.last_sensor != sensor_idx:
             soc_change -= 1  # penalty when switching sensors
@@ -360,27 +533,31 @@ class Game:
         self._spin_windmill_briefly()
         self._randomise_leds()
 
-        while read_button("charge") or read_button("discharge"):
-            time.sleep(0.01)
-
     # ----------------------------- Helpers --------------------------- #
 
     def _get_active_sensor(self) -> Optional[int]:
-        for idx in range(NUM_SENSORS):
-            if read_sensor(idx):
-                return idx
+        low = read_sensors()  # one read for all sensors
+        if low:
+            for idx, bit in enumerate(_SENSOR_BITS):
+                if low >> bit & 1:
+                    return idx
         return None
 
     def _randomise_leds(self) -> None:
-        self.led_values = [random.randint(0, 1) for _ in range(NUM_SENSORS)]
-        for idx, val in enumerate(self.led_values):
-            set_led(idx, LED_COLOR[val], on=True)
+        bits = random.getrandbits(NUM_SENSORS)  # one draw, one bit per LED
+        self.led_values = bits
+        for idx in range(NUM_SENSORS):
+            set_led(idx, (bits >> idx) & 1, on=True)
 
-    @staticmethod
-    def _spin_windmill_briefly() -> None:
+    def _spin_windmill_briefly(self) -> None:
+        """Spin for 200 ms; _play_round stops it once the deadline passes."""
         set_windmill(True)
-        time.sleep(0.2)
-        set_windmill(False)
+        self._windmill_off_ns = time.monotonic_ns() + WINDMILL_NS
+
+    def _stop_windmill_if_due(self) -> None:
+        if self._windmill_off_ns is not None and time.monotonic_ns() >= self._windmill_off_ns:
+            set_windmill(False)
+            self._windmill_off_ns = None
 
     def _full_reset(self) -> None:
         self.score = 0
@@ -393,8 +570,10 @@ class Game:
         self.actions = 0
         self.soc = SOC_LEVELS // 2
         self.last_sensor: Optional[int] = None
-        self.last_action_ts: List[float] = [0.0] * NUM_SENSORS
-        self.led_values: List[int] = [0] * NUM_SENSORS
+        self.next_allowed_ns: List[int] = [0] * NUM_SENSORS  # cooldown deadlines
+        self.led_values = 0  # bit i: 0 = red, 1 = green for sensor i
+        self._windmill_off_ns: Optional[int] = None  # monotonic_ns, while spinning
+        self._last_any_active: Optional[bool] = None
 
 ###########################################################################
 #                                 Main                                    #
@@ -410,7 +589,7 @@ def _game_worker() -> None:
     finally:
         # tidy‑up on exit (Ctrl‑C)
         for i in range(NUM_SENSORS):
-            set_led(i, "off", on=False)
+            set_led(i, on=False)
         set_button_led("charge", False)
         set_button_led("discharge", False)
         set_windmill(False)